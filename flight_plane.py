@@ -1,10 +1,25 @@
 import logging
+import os
+import struct
+import threading
 import time
 import json
 import numpy as np
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    from numba import njit
+except ImportError:
+    # Without numba, run the "jitted" functions as plain Python
+    def njit(*args, **kwargs):
+        return lambda f: f
 import cflib.crtp
 from cflib.crazyflie import Crazyflie
-from cflib.crazyflie.log import LogConfig
+from cflib.crazyflie.commander import SET_SETPOINT_CHANNEL, TYPE_POSITION
+from cflib.crazyflie.log import LogConfig, LogTocElement
+from cflib.crtp.crtpstack import CRTPPacket, CRTPPort
 
 # Specify the uri of the drone to which we want to connect (if your radio
 # channel is X, the uri should be 'radio://0/X/2M/E7E7E7E7E7')
@@ -55,6 +70,101 @@ variables = [
     'ae483log.m_4',
 ]
 
+# Load the waypoints that trace the outline of the plane (generated offline
+# by make_plane_waypoints.py)
+WAYPOINTS = np.load(os.path.join(os.path.dirname(__file__), 'plane_waypoints.npy'))
+
+# Each row of a segment table is a point to fly to in a straight line from
+# the point in the previous row, the length of that segment, the speed at
+# which to fly it, and how long to hold position at the end of it (the first
+# row is the starting point, which is held for its dwell time)
+SEGMENT_DTYPE = np.dtype([
+    ('p', np.float32, 3),
+    ('dist', np.float32),
+    ('speed', np.float32),
+    ('dwell', np.float32),
+])
+
+# Period (seconds) at which setpoints are sent to the drone
+PERIOD = 0.1
+
+# Period (seconds) at which a constant setpoint is repeated while holding
+# position - must stay below the 500 ms setpoint watchdog on the drone
+HOLD_PERIOD = 0.4
+
+# Packer for the payload of a position setpoint packet (type, x, y, z, yaw)
+_POSPACK = struct.Struct('<Bffff').pack
+
+# Number of samples to preallocate for each logged variable (60 seconds at
+# 100 Hz, with a factor of two to spare) - buffers grow if this is exceeded
+LOG_CAPACITY = 60 * 100 * 2
+
+
+def compile_segments(rows):
+    # Build a segment table from rows of (x, y, z, speed, dwell), dropping
+    # any point that lies in the middle of a straight line flown at constant
+    # speed (there is no corner to pause at, so the two segments are merged)
+    table = np.zeros(len(rows), SEGMENT_DTYPE)
+    for i, (x, y, z, speed, dwell) in enumerate(rows):
+        table[i] = ((x, y, z), 0.0, speed, dwell)
+
+    # Drop any point that is the same as the one before it (a segment of zero
+    # length cannot be flown), keeping the longer of their dwell times
+    keep = [0]
+    for i in range(1, len(table)):
+        if np.linalg.norm(table['p'][i] - table['p'][keep[-1]]) <= 1e-6:
+            table['dwell'][keep[-1]] = max(table['dwell'][keep[-1]], table['dwell'][i])
+        else:
+            keep.append(i)
+    table = table[keep]
+
+    keep = [0]
+    for i in range(1, len(table) - 1):
+        d1 = table['p'][i] - table['p'][keep[-1]]
+        d2 = table['p'][i + 1] - table['p'][i]
+        colinear = (np.dot(d1, d2) > 0 and
+                    np.linalg.norm(np.cross(d1, d2)) <= 1e-6 * np.linalg.norm(d1) * np.linalg.norm(d2))
+        if not (colinear and table['speed'][i] == table['speed'][i + 1]):
+            keep.append(i)
+    if len(table) > 1:
+        keep.append(len(table) - 1)
+    table = table[keep]
+    table['dist'][1:] = np.linalg.norm(np.diff(table['p'], axis=0), axis=1)
+    return table
+
+
+# Flight plan: take off, trace the outline of the plane at 0.2 m/s pausing
+# at each corner, then descend
+SEGMENTS = compile_segments(
+    [(0.0, 0.0, 0.15, 0.0, 1.0)]
+    + [(x, y, z, 0.2, 1.0 if i == 0 else 0.5) for i, (x, y, z) in enumerate(WAYPOINTS)]
+    + [(*WAYPOINTS[-1, :2], 0.15, 0.2, 1.0)]
+)
+
+
+# Compiled eagerly for this signature (at import, not on the first call
+# during flight) - callers pass Python floats, which numba dispatches on
+# much faster than NumPy float32 scalars
+@njit('UniTuple(float64, 4)(float64, float64, float64, float64, float64, float64, float64, float64, float64)', cache=True)
+def _interp(p1x, p1y, p1z, dx, dy, dz, inv_dist, speed, elapsed):
+    # Fraction of the distance from p1 to p2 that should have been travelled
+    # after elapsed seconds (never past p2), and the corresponding position
+    s = min(elapsed*speed*inv_dist, 1.0)
+    return p1x + s*dx, p1y + s*dy, p1z + s*dz, s
+
+
+class TupleLogConfig(LogConfig):
+    # Passes the logged values to data_received_cb as a tuple in the order of
+    # self.variables, unpacked with one precompiled struct rather than one
+    # struct.unpack and dict entry per variable
+    _unpack = None
+
+    def unpack_log_data(self, log_data, timestamp):
+        if self._unpack is None:
+            fmt = '<' + ''.join(LogTocElement.get_unpack_string_from_id(v.fetch_as)[1:] for v in self.variables)
+            self._unpack = struct.Struct(fmt).unpack_from
+        self.data_received_cb.call(timestamp, self._unpack(log_data), self)
+
 
 class SimpleClient:
     def __init__(self, uri, use_controller=True, use_observer=False):
@@ -67,17 +177,38 @@ class SimpleClient:
         self.cf.connection_failed.add_callback(self.connection_failed)
         self.cf.connection_lost.add_callback(self.connection_lost)
         self.cf.disconnected.add_callback(self.disconnected)
+        self._ready = threading.Event()
+        self.data = {}
+        for v in variables:
+            self.data[v] = {
+                'time': np.empty(LOG_CAPACITY, np.uint32),
+                'data': np.empty(LOG_CAPACITY, np.float32),
+                'n': 0,
+            }
+
+        # Setpoints are sent at a fixed cadence by their own thread - move and
+        # move_smooth only publish a trajectory in self._setpoint for it to
+        # follow, as (p1x, p1y, p1z, dx, dy, dz, inv_dist, speed, start, yaw)
+        self._setpoint = None
+        self._setpoint_lock = threading.Lock()
+        self._sender_done = threading.Event()
+        self._sender = threading.Thread(target=self.send_setpoints, daemon=True)
+        self._sender.start()
+
+        # Open the link last, once everything the callbacks use exists
         print(f'Connecting to {uri}')
         self.cf.open_link(uri)
-        self.is_fully_connected = False
-        self.data = {}
 
     def connected(self, uri):
         print(f'Connected to {uri}')
     
     def fully_connected(self, uri):
         print(f'Fully connected to {uri}')
-        self.is_fully_connected = True
+
+        # Parameter values are all sent without waiting for replies (they go
+        # out in order, so once the last one is written back to us we know
+        # that all of them have been applied)
+        self.cf.param.add_update_callback(group='ae483par', name='use_observer', cb=self.params_updated)
 
         # Reset the default observer
         self.cf.param.set_value('kalman.resetEstimation', 1)
@@ -100,20 +231,39 @@ class SimpleClient:
             self.cf.param.set_value('ae483par.use_observer', 0)
 
         # Start logging
+        #
+        # Each log packet has room for LogConfig.MAX_LEN bytes of data, so pack
+        # variables into as few configurations as possible according to their
+        # sizes (first-fit decreasing). Variables that are not in the TOC are
+        # assumed to be 4 bytes - add_config will report them below.
+        toc_map = {v: self.cf.log.toc.get_element_by_complete_name(v) for v in variables}
+        sizes = {}
+        for v, element in toc_map.items():
+            sizes[v] = struct.calcsize(element.pytype) if element else 4
+        bins = []
+        for v in sorted(variables, key=lambda v: sizes[v], reverse=True):
+            for b in bins:
+                if b['size'] + sizes[v] <= LogConfig.MAX_LEN:
+                    break
+            else:
+                b = {'size': 0, 'variables': []}
+                bins.append(b)
+            b['size'] += sizes[v]
+            b['variables'].append(v)
         self.logconfs = []
-        self.logconfs.append(LogConfig(name=f'LogConf0', period_in_ms=10))
-        num_variables = 0
-        for v in variables:
-            num_variables += 1
-            if num_variables > 5: # <-- could increase if you paid attention to types / sizes (max 30 bytes per packet)
-                num_variables = 0
-                self.logconfs.append(LogConfig(name=f'LogConf{len(self.logconfs)}', period_in_ms=10))
-            self.data[v] = {'time': [], 'data': []}
-            self.logconfs[-1].add_variable(v)
+        for b in bins:
+            self.logconfs.append(TupleLogConfig(name=f'LogConf{len(self.logconfs)}', period_in_ms=10))
+            for v in b['variables']:
+                # Passing the type we already looked up saves add_config from
+                # looking up each variable in the TOC again to find it
+                if toc_map[v]:
+                    self.logconfs[-1].add_variable(v, toc_map[v].ctype)
+                else:
+                    self.logconfs[-1].add_variable(v)
         for logconf in self.logconfs:
             try:
                 self.cf.log.add_config(logconf)
-                logconf.data_received_cb.add_callback(self.log_data)
+                logconf.data_received_cb.add_callback(self.log_data_callback(logconf))
                 logconf.error_cb.add_callback(self.log_error)
                 logconf.start()
             except KeyError as e:
@@ -125,6 +275,17 @@ class SimpleClient:
                 for v in logconf.variables:
                     print(f' - {v.name}')
 
+    def params_updated(self, name, value):
+        self.cf.param.remove_update_callback(group='ae483par', name='use_observer', cb=self.params_updated)
+        self._ready.set()
+
+    @property
+    def is_fully_connected(self):
+        return self._ready.is_set()
+
+    def wait_ready(self, timeout=None):
+        return self._ready.wait(timeout)
+
     def connection_failed(self, uri, msg):
         print(f'Connection to {uri} failed: {msg}')
 
@@ -133,140 +294,167 @@ class SimpleClient:
 
     def disconnected(self, uri):
         print(f'Disconnected from {uri}')
-        self.is_fully_connected = False
+        self._ready.clear()
+
+    def log_data_callback(self, logconf):
+        # Return a callback that stores data for the variables in logconf,
+        # with their names looked up once here rather than on every packet
+        # (must be called after add_config, which fills in logconf.variables)
+        names = tuple(v.name for v in logconf.variables)
+
+        def log_data(timestamp, values, logconf, names=names, store=self.data):
+            for n, value in zip(names, values):
+                d = store[n]
+                i = d['n']
+                if i == len(d['data']):
+                    d['time'] = np.resize(d['time'], 2 * i)
+                    d['data'] = np.resize(d['data'], 2 * i)
+                d['time'][i] = timestamp
+                d['data'][i] = value
+                d['n'] = i + 1
 
-    def log_data(self, timestamp, data, logconf):
-        for v in logconf.variables:
-            self.data[v.name]['time'].append(timestamp)
-            self.data[v.name]['data'].append(data[v.name])
+        return log_data
 
     def log_error(self, logconf, msg):
         print(f'Error when logging {logconf}: {msg}')
 
+    def _send_pos(self, x, y, z, yaw):
+        # Same packet as cf.commander.send_position_setpoint, but packed with
+        # a precompiled struct
+        pk = CRTPPacket()
+        pk.port = CRTPPort.COMMANDER_GENERIC
+        pk.channel = SET_SETPOINT_CHANNEL
+        pk.data = _POSPACK(TYPE_POSITION, x, y, z, yaw)
+        self.cf.send_packet(pk)
+
+    def send_setpoints(self):
+        # Evaluate the current trajectory and send the resulting setpoint
+        # every PERIOD seconds while it is moving, and every HOLD_PERIOD
+        # seconds once it is not
+        hold_ticks = round(HOLD_PERIOD / PERIOD)
+        last = None
+        moving = False
+        ticks = 0
+        next_t = time.monotonic()
+        while not self._sender_done.wait(max(0.0, next_t - time.monotonic())):
+            next_t += PERIOD
+            ticks += 1
+            with self._setpoint_lock:
+                setpoint = self._setpoint
+                if setpoint is None:
+                    last = None
+                elif setpoint is not last or moving or ticks >= hold_ticks:
+                    p1x, p1y, p1z, dx, dy, dz, inv_dist, speed, start, yaw = setpoint
+                    px, py, pz, s = _interp(p1x, p1y, p1z, dx, dy, dz, inv_dist, speed, time.monotonic() - start)
+                    self._send_pos(px, py, pz, yaw)
+                    last = setpoint
+                    moving = speed > 0 and s < 1
+                    ticks = 0
+
     def move(self, x, y, z, yaw, dt):
-        print(f'Move to {x}, {y}, {z} with yaw {yaw} degrees for {dt} seconds')
-        start_time = time.time()
-        while time.time() - start_time < dt:
-            self.cf.commander.send_position_setpoint(x, y, z, yaw)
-            time.sleep(0.1)
+        print(f'Move to {x:g}, {y:g}, {z:g} with yaw {yaw:g} degrees for {dt:g} seconds')
+        # A trajectory that stays at (x, y, z), in Python floats (the segment
+        # table passes NumPy float32 values)
+        x, y, z, yaw, dt = float(x), float(y), float(z), float(yaw), float(dt)
+        self._setpoint = (x, y, z, 0.0, 0.0, 0.0, 0.0, 0.0, time.monotonic(), yaw)
+        time.sleep(dt)
     
-    def move_smooth(self, p1, p2, yaw, speed):
-        print(f'Move smoothly from {p1} to {p2} with yaw {yaw} degrees at {speed} meters / second')
-        p1 = np.array(p1)
-        p2 = np.array(p2)
+    def move_smooth(self, p1, p2, dist, yaw, speed):
+        p1 = np.asarray(p1, dtype=np.float64)
+        p2 = np.asarray(p2, dtype=np.float64)
+        print(f'Move smoothly from [{p1[0]:g}, {p1[1]:g}, {p1[2]:g}] to [{p2[0]:g}, {p2[1]:g}, {p2[2]:g}] with yaw {yaw:g} degrees at {speed:g} meters / second')
+        delta = p2 - p1
         
-        # Compute distance from p1 to p2
-        distance_from_p1_to_p2 = np.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2 + (p2[2] - p1[2])**2)
+        # Compute distance from p1 to p2 (unless precomputed by the caller)
+        if dist is None:
+            dist = np.linalg.norm(delta)
+        distance_from_p1_to_p2 = float(dist)
+        inv_dist = 1.0 / distance_from_p1_to_p2
         
         # Compute time it takes to move from p1 to p2 at desired speed
+        speed = float(speed)
         time_from_p1_to_p2 = distance_from_p1_to_p2/speed
         
-        start_time = time.time()
-        while True:
-            current_time = time.time()
-            
-            # Compute what fraction of the distance from p1 to p2 should have
-            # been travelled by the current time
-            s = (current_time-start_time)*speed/distance_from_p1_to_p2
-            
-            # Compute where the drone should be at the current time, in the
-            # coordinates of the world frame
-            p = np.array([p1[0] + s*(p2[0] - p1[0]), p1[1] + s*(p2[1] - p1[1]), p1[2] + s*(p2[2] - p1[2])])
-            
-            self.cf.commander.send_position_setpoint(p[0], p[1], p[2], yaw)
-            if s >= 1:
-                return
-            else:
-                time.sleep(0.1)
+        # Hand the trajectory to the sender thread, which computes where the
+        # drone should be each time it sends a setpoint, and wait for it (the
+        # trajectory is in Python floats, converted once here)
+        p1x, p1y, p1z = p1.tolist()
+        dx, dy, dz = delta.tolist()
+        yaw = float(yaw)
+        start = time.monotonic()
+        self._setpoint = (p1x, p1y, p1z, dx, dy, dz, inv_dist, speed, start, yaw)
+        dt_sleep = start + time_from_p1_to_p2 - time.monotonic()
+        if dt_sleep > 0:
+            time.sleep(dt_sleep)
+
+    def move_segments(self, segments, yaw):
+        p = segments['p']
+        self.move(*p[0], yaw, segments['dwell'][0])
+        for i in range(1, len(segments)):
+            self.move_smooth(p[i - 1], p[i], segments['dist'][i], yaw, segments['speed'][i])
+            if segments['dwell'][i] > 0:
+                self.move(*p[i], yaw, segments['dwell'][i])
 
     def stop(self, dt):
         print(f'Stop for {dt} seconds')
-        self.cf.commander.send_stop_setpoint()
-        start_time = time.time()
-        while time.time() - start_time < dt:
-            time.sleep(0.1)
+        with self._setpoint_lock:
+            self._setpoint = None
+            self.cf.commander.send_stop_setpoint()
+        time.sleep(dt)
 
     def disconnect(self):
+        self._sender_done.set()
+        self._sender.join()
         self.cf.close_link()
 
     def write_data(self, filename='logged_data.json'):
-        with open(filename, 'w') as outfile:
-            json.dump(self.data, outfile, indent=4, sort_keys=False)
+        # Compressed binary format (load with np.load) if asked for .npz
+        if filename.endswith('.npz'):
+            arrays = {}
+            for k, v in self.data.items():
+                arrays[f'{k}__t'] = v['time'][:v['n']]
+                arrays[f'{k}__d'] = v['data'][:v['n']]
+            np.savez_compressed(filename, **arrays)
+            return
+
+        # Otherwise JSON, serialized straight from the arrays by orjson when
+        # it is installed
+        if orjson is not None:
+            data = {}
+            for k, v in self.data.items():
+                data[k] = {'time': v['time'][:v['n']], 'data': v['data'][:v['n']]}
+            with open(filename, 'wb') as outfile:
+                outfile.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+        else:
+            data = {}
+            for k, v in self.data.items():
+                data[k] = {
+                    'time': v['time'][:v['n']].tolist(),
+                    'data': v['data'][:v['n']].tolist(),
+                }
+            with open(filename, 'w') as outfile:
+                json.dump(data, outfile, indent=4, sort_keys=False)
 
 
 if __name__ == '__main__':
     # Initialize everything
-    logging.basicConfig(level=logging.ERROR)
+    cflib_logger = logging.getLogger('cflib')
+    cflib_logger.addHandler(logging.NullHandler())
+    cflib_logger.setLevel(logging.CRITICAL + 1)
+    cflib_logger.propagate = False
     cflib.crtp.init_drivers()
 
     # Create and start the client that will connect to the drone
     client = SimpleClient(uri, use_controller=True, use_observer=True)
-    while not client.is_fully_connected:
-        time.sleep(0.1)
+    if not client.wait_ready(timeout=10.0):
+        client.disconnect()
+        raise RuntimeError(f'Timed out connecting to {uri}')
 
     # Leave time at the start to initialize
     client.stop(1.0)
 
     # PLANE
-    client.move(0.0, 0.0, 0.15, 0.0, 1.0)
-    client.move_smooth([0.0, 0.0, 0.15], [0.0, 0.0, 0.35], 0.0, 0.2)
-    client.move(0.0, 0.0, 0.35, 0.0, 1.0)
-
-    client.move_smooth([0.0, 0.0, .35], [0.48606811145510836, 0.9936708860759493, 0.35], 0.0, 0.2)
-    client.move(0.48606811145510836, 0.9936708860759493, 0.35, 0.0, 0.5)
-    client.move_smooth([0.48606811145510836, 0.9936708860759493, .35], [0.5139318885448917, 1.0, 0.35], 0.0, 0.2)
-    client.move(0.5139318885448917, 1.0, .35, 0.0, 0.5)
-    client.move_smooth([0.5139318885448917, 1.0, .35], [0.5789473684210527, 0.8860759493670886, 0.35], 0.0, 0.2)
-    client.move(0.5789473684210527, 0.8860759493670886, .35, 0.0, 0.5)
-    client.move_smooth([0.5789473684210527, 0.8860759493670886, .35], [0.5882352941176471, 0.6962025316455697, 0.35], 0.0, 0.2)
-    client.move(0.5882352941176471, 0.6962025316455697, .35, 0.0, 0.5)
-    client.move_smooth([0.5882352941176471, 0.6962025316455697, .35], [0.7987616099071208, 0.560126582278481, 0.35], 0.0, 0.2)
-    client.move(0.7987616099071208, 0.560126582278481, .35, 0.0, 0.5)
-    client.move_smooth([0.7987616099071208, 0.560126582278481, .35], [1.0, 0.4240506329113924, 0.35], 0.0, 0.2)
-    client.move(1.0, 0.4240506329113924, .35, 0.0, 0.5)
-    client.move_smooth([1.0, 0.4240506329113924, .35], [1.0, 0.36075949367088606, 0.35], 0.0, 0.2)
-    client.move(1.0, 0.36075949367088606, .35, 0.0, 0.5)
-    client.move_smooth([1.0, 0.36075949367088606, .35], [0.7585139318885449, 0.4177215189873418, 0.35], 0.0, 0.2)
-    client.move(0.7585139318885449, 0.4177215189873418, .35, 0.0, 0.5)
-    client.move_smooth([0.7585139318885449, 0.4177215189873418, .35], [0.5789473684210527, 0.4651898734177215, 0.35], 0.0, 0.2)
-    client.move(0.5789473684210527, 0.4651898734177215, .35, 0.0, 0.5)
-    client.move_smooth([0.5789473684210527, 0.4651898734177215, .35], [0.56656346749226, 0.17405063291139242, 0.35], 0.0, 0.2)
-    client.move(0.56656346749226, 0.17405063291139242, .35, 0.0, 0.5)
-    client.move_smooth([0.56656346749226, 0.17405063291139242, .35], [0.6873065015479877, 0.04430379746835443, 0.35], 0.0, 0.2)
-    client.move(0.6873065015479877, 0.04430379746835443, .35, 0.0, 0.5)
-    client.move_smooth([0.6873065015479877, 0.04430379746835443, .35], [0.6904024767801857, 0.012658227848101266, 0.35], 0.0, 0.2)
-    client.move(0.6904024767801857, 0.012658227848101266, .35, 0.0, 0.5)
-    client.move_smooth([0.6904024767801857, 0.012658227848101266, .35], [0.5325077399380805, 0.056962025316455694, 0.35], 0.0, 0.2)
-    client.move(0.5325077399380805, 0.056962025316455694, .35, 0.0, 0.5)
-    client.move_smooth([0.5325077399380805, 0.056962025316455694, .35], [0.5139318885448917, 0.015822784810126583, 0.35], 0.0, 0.2)
-    client.move(0.5139318885448917, 0.015822784810126583, .35, 0.0, 0.5)
-    client.move_smooth([0.5139318885448917, 0.015822784810126583, .35], [0.49226006191950467, 0.012658227848101266, 0.35], 0.0, 0.2)
-    client.move(0.49226006191950467, 0.012658227848101266, .35, 0.0, 0.5)
-    client.move_smooth([0.49226006191950467, 0.012658227848101266, .35], [0.4674922600619195, 0.05379746835443038, 0.35], 0.0, 0.2)
-    client.move(0.4674922600619195, 0.05379746835443038, .35, 0.0, 0.5)
-    client.move_smooth([0.4674922600619195, 0.05379746835443038, .35], [0.3219814241486068, 0.0, 0.35], 0.0, 0.2)
-    client.move(0.3219814241486068, 0.0, .35, 0.0, 0.5)
-    client.move_smooth([0.3219814241486068, 0.0, .35], [0.3157894736842105, 0.0379746835443038, 0.35], 0.0, 0.2)
-    client.move(0.3157894736842105, 0.0379746835443038, .35, 0.0, 0.5)
-    client.move_smooth([0.3157894736842105, 0.0379746835443038, .35], [0.43034055727554177, 0.16455696202531644, 0.35], 0.0, 0.2)
-    client.move(0.43034055727554177, 0.16455696202531644, .35, 0.0, 0.5)
-    client.move_smooth([0.43034055727554177, 0.16455696202531644, .35], [0.42105263157894735, 0.4620253164556962, 0.35], 0.0, 0.2)
-    client.move(0.42105263157894735, 0.4620253164556962, .35, 0.0, 0.5)
-    client.move_smooth([0.42105263157894735, 0.4620253164556962, .35], [0.2260061919504644, 0.41455696202531644, 0.35], 0.0, 0.2)
-    client.move(0.2260061919504644, 0.41455696202531644, .35, 0.0, 0.5)
-    client.move_smooth([0.2260061919504644, 0.41455696202531644, .35], [0.0030959752321981426, 0.35443037974683544, 0.35], 0.0, 0.2)
-    client.move(0.0030959752321981426, 0.35443037974683544, .35, 0.0, 0.5)
-    client.move_smooth([0.0030959752321981426, 0.35443037974683544, .35], [0.0, 0.4240506329113924, 0.35], 0.0, 0.2)
-    client.move(0.0, 0.4240506329113924, .35, 0.0, 0.5)
-    client.move_smooth([0.0, 0.4240506329113924, .35], [0.20743034055727555, 0.560126582278481, 0.35], 0.0, 0.2)
-    client.move(0.20743034055727555, 0.560126582278481, .35, 0.0, 0.5)
-    client.move_smooth([0.20743034055727555, 0.560126582278481, .35], [0.4086687306501548, 0.6930379746835443, 0.35], 0.0, 0.2)
-    client.move(0.4086687306501548, 0.6930379746835443, .35, 0.0, 0.5)
-    client.move_smooth([0.4086687306501548, 0.6930379746835443, .35], [0.43343653250773995, 0.9367088607594937, 0.35], 0.0, 0.2)
-    client.move(0.43343653250773995, 0.9367088607594937, .35, 0.0, 0.5)
-
-    client.move_smooth([0.43343653250773995, 0.9367088607594937, 0.35], [0.43343653250773995, 0.9367088607594937, 0.15], 0.0, 0.2)
-    client.move(0.43343653250773995, 0.9367088607594937, 0.15, 0.0, 1.0)
+    client.move_segments(SEGMENTS, 0.0)
 
     # Land
     client.stop(1.0)
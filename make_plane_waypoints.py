@@ -0,0 +1,70 @@
+import os
+import numpy as np
+
+# Flight altitude (meters) at which the outline is traced
+z = 0.35
+
+# Largest distance (meters) that a dropped point may lie from the simplified
+# outline - tune this to the size of the flight area
+epsilon = 0.01
+
+# Outline of the plane as (x, y) coordinates in meters, starting from the
+# point above the takeoff location
+outline = [
+    (0.0, 0.0),
+    (0.48606811145510836, 0.9936708860759493),
+    (0.5139318885448917, 1.0),
+    (0.5789473684210527, 0.8860759493670886),
+    (0.5882352941176471, 0.6962025316455697),
+    (0.7987616099071208, 0.560126582278481),
+    (1.0, 0.4240506329113924),
+    (1.0, 0.36075949367088606),
+    (0.7585139318885449, 0.4177215189873418),
+    (0.5789473684210527, 0.4651898734177215),
+    (0.56656346749226, 0.17405063291139242),
+    (0.6873065015479877, 0.04430379746835443),
+    (0.6904024767801857, 0.012658227848101266),
+    (0.5325077399380805, 0.056962025316455694),
+    (0.5139318885448917, 0.015822784810126583),
+    (0.49226006191950467, 0.012658227848101266),
+    (0.4674922600619195, 0.05379746835443038),
+    (0.3219814241486068, 0.0),
+    (0.3157894736842105, 0.0379746835443038),
+    (0.43034055727554177, 0.16455696202531644),
+    (0.42105263157894735, 0.4620253164556962),
+    (0.2260061919504644, 0.41455696202531644),
+    (0.0030959752321981426, 0.35443037974683544),
+    (0.0, 0.4240506329113924),
+    (0.20743034055727555, 0.560126582278481),
+    (0.4086687306501548, 0.6930379746835443),
+    (0.43343653250773995, 0.9367088607594937),
+]
+
+
+def rdp(points, epsilon):
+    # Simplify a polyline with the Ramer-Douglas-Peucker algorithm: keep the
+    # end points, and recursively keep the point farthest from the line
+    # between them as long as it is more than epsilon away
+    start, end = points[0], points[-1]
+    line = end - start
+    length = np.linalg.norm(line)
+    if length > 0:
+        offsets = points - start
+        distances = np.abs(line[0]*offsets[:, 1] - line[1]*offsets[:, 0]) / length
+    else:
+        distances = np.linalg.norm(points - start, axis=1)
+    i = np.argmax(distances)
+    if distances[i] > epsilon:
+        return np.vstack((rdp(points[:i + 1], epsilon)[:-1], rdp(points[i:], epsilon)))
+    return np.vstack((start, end))
+
+
+if __name__ == '__main__':
+    # Drop points that barely change the shape of the outline
+    points = rdp(np.array(outline), epsilon)
+    print(f'Simplified outline from {len(outline)} to {len(points)} points')
+
+    # Store the waypoints as an (N, 3) array for flight_plane.py to load
+    waypoints = np.array([(x, y, z) for x, y in points], dtype=np.float32)
+    np.save(os.path.join(os.path.dirname(__file__), 'plane_waypoints.npy'), waypoints)
+    print(f'Saved {len(waypoints)} waypoints to plane_waypoints.npy')